@@ -4,6 +4,7 @@ Advanced video creator with effects, templates, and customization
 
 import tempfile
 import io
+from dataclasses import replace
 from typing import List, Dict, Optional, Tuple
 from PIL import Image
 import numpy as np
@@ -123,12 +124,12 @@ class AdvancedVideoCreator:
         frames_per_scene = seconds_per_image * fps
         processed_frames = []
         
+        # Apply base effects to all scenes in parallel
+        images = self.effects_processor.process_frames(images, template.effects)
+        
         for scene_idx, image in enumerate(images):
             st.info(f"Processing scene {scene_idx + 1}/{len(images)}...")
             
-            # Apply base effects
-            image = self.effects_processor.apply_effects(image, template.effects)
-            
             # Generate frames for this scene
             scene_frames = self._generate_scene_frames(
                 image, template, frames_per_scene, fps
@@ -206,8 +207,10 @@ class AdvancedVideoCreator:
                 )
                 frames.append(frame)
         else:
-            # Static scene
-            frames = [image.copy() for _ in range(num_frames)]
+            # Static scene: every frame is the same image object. Later
+            # steps replace frames rather than modify them, and sharing
+            # one object lets transitions take their still-image paths
+            frames = [image] * num_frames
         
         return frames
     
@@ -218,17 +221,9 @@ class AdvancedVideoCreator:
         transition: TransitionConfig
     ) -> List[Image.Image]:
         """Create transition between two sets of frames."""
-        transition_frames = []
-        num_frames = min(len(frames1), len(frames2))
-        
-        for i in range(num_frames):
-            progress = i / num_frames
-            transition_frame = self.effects_processor.apply_transition(
-                frames1[i], frames2[i], transition, progress
-            )
-            transition_frames.append(transition_frame)
-        
-        return transition_frames
+        return self.effects_processor.apply_transition_sequence(
+            frames1, frames2, transition
+        )
     
     def _add_title_sequence(
         self,
@@ -253,7 +248,7 @@ class AdvancedVideoCreator:
             progress = (i + 1) / title_frames  # Avoid division by zero
             frames[i] = self.text_system.add_text_overlay(
                 frames[i], title, title_style, progress
-            )
+            ).convert('RGB')
         
         return frames
     
@@ -284,7 +279,7 @@ class AdvancedVideoCreator:
                     "Thank You for Watching",
                     story.get("call_to_action", "Subscribe for more!"),
                     {"YouTube": "@yourchannel", "Instagram": "@yourig"}
-                )
+                ).convert('RGB')
         
         return frames
     
@@ -376,8 +371,11 @@ class AdvancedVideoCreator:
             with open(audio_file, 'wb') as f:
                 f.write(audio_bytes)
             
-            # Convert PIL images to numpy arrays
-            frame_arrays = [np.array(frame) for frame in frames]
+            # Convert PIL images to numpy arrays (captioned frames are RGBA)
+            frame_arrays = [
+                np.asarray(frame if frame.mode == 'RGB' else frame.convert('RGB'))
+                for frame in frames
+            ]
             
             # Create video clip
             video = ImageSequenceClip(frame_arrays, fps=fps)
@@ -420,7 +418,7 @@ class AdvancedVideoCreator:
         # Write frames
         for frame in frames:
             # Convert PIL to OpenCV format
-            frame_array = np.array(frame)
+            frame_array = np.asarray(frame if frame.mode == 'RGB' else frame.convert('RGB'))
             frame_bgr = cv2.cvtColor(frame_array, cv2.COLOR_RGB2BGR)
             out.write(frame_bgr)
         
@@ -431,19 +429,19 @@ class AdvancedVideoCreator:
         template: VideoTemplate,
         custom_settings: Dict
     ) -> VideoTemplate:
-        """Apply custom settings to template."""
-        # Override template settings with custom ones
+        """Apply custom settings to a copy of the template."""
+        # Templates are shared library instances, so never modify them
+        updates = {}
         if "effects" in custom_settings:
-            for key, value in custom_settings["effects"].items():
-                setattr(template.effects, key, value)
+            updates["effects"] = replace(template.effects, **custom_settings["effects"])
         
         if "transitions" in custom_settings:
-            template.transitions = custom_settings["transitions"]
+            updates["transitions"] = custom_settings["transitions"]
         
         if "text_styles" in custom_settings:
-            template.text_styles.update(custom_settings["text_styles"])
+            updates["text_styles"] = {**template.text_styles, **custom_settings["text_styles"]}
         
-        return template
+        return replace(template, **updates)
     
     def _generate_video_metadata(
         self,
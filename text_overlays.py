@@ -6,10 +6,23 @@ from PIL import Image, ImageDraw, ImageFont, ImageFilter
 from typing import List, Tuple, Dict, Optional
 import textwrap
 from dataclasses import dataclass
+import functools
+import io
+import itertools
+import math
 import os
 
+import numpy as np
 
-@dataclass
+# Try to import numba, but make it optional
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+@dataclass(frozen=True)
 class TextStyle:
     """Text styling configuration."""
     font_family: str = "Arial"
@@ -29,7 +42,50 @@ class TextStyle:
     animation: str = "none"  # none, fade, slide, typewriter, bounce
 
 
-@dataclass
+@functools.lru_cache(maxsize=32)
+def _gaussian_kernel(sigma: float) -> np.ndarray:
+    """Build a normalized 1D Gaussian kernel covering +/- 3 sigma."""
+    radius = max(1, int(math.ceil(sigma * 3)))
+    taps = np.arange(-radius, radius + 1, dtype=np.float32)
+    kernel = np.exp(-(taps * taps) / (2.0 * sigma * sigma))
+    kernel /= kernel.sum()
+    kernel.setflags(write=False)
+    return kernel
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _gaussian_blur_1d(src, dst, kernel):
+        """Convolve every row of src with kernel, clamping at the edges."""
+        rows, cols = src.shape
+        radius = kernel.shape[0] // 2
+        for r in prange(rows):
+            for c in range(cols):
+                acc = 0.0
+                for k in range(kernel.shape[0]):
+                    cc = min(max(c + k - radius, 0), cols - 1)
+                    acc += src[r, cc] * kernel[k]
+                dst[r, c] = acc
+
+
+def _blur_alpha(mask: Image.Image, sigma: float) -> Image.Image:
+    """Gaussian-blur a single-channel alpha mask."""
+    if not NUMBA_AVAILABLE:
+        return mask.filter(ImageFilter.GaussianBlur(radius=sigma))
+    
+    kernel = _gaussian_kernel(float(sigma))
+    src = np.asarray(mask, dtype=np.float32)
+    tmp = np.empty_like(src)
+    _gaussian_blur_1d(src, tmp, kernel)
+    
+    # Vertical pass runs as a horizontal pass over the transpose
+    src = np.ascontiguousarray(tmp.T)
+    out = np.empty_like(src)
+    _gaussian_blur_1d(src, out, kernel)
+    return Image.fromarray(np.clip(out.T + 0.5, 0, 255).astype(np.uint8))
+
+
+@dataclass(frozen=True)
 class Caption:
     """Video caption/subtitle."""
     text: str
@@ -39,13 +95,106 @@ class Caption:
     position_override: Optional[str] = None
 
 
+@dataclass
+class _TextLayout:
+    """Frame-independent placement of one overlay."""
+    text: str
+    style: TextStyle
+    font: ImageFont.FreeTypeFont
+    x: int
+    y: int
+    text_bbox: Tuple[int, int, int, int]  # box of the text drawn at (0, 0)
+    masks: Optional[Tuple[Image.Image, Optional[Image.Image], Optional[Image.Image]]] = None
+
+
+# Shared scratch surface for text measurement
+_MEASURE_DRAW = ImageDraw.Draw(Image.new('L', (1, 1)))
+
+
+@functools.lru_cache(maxsize=256)
+def _calculate_position(
+    img_size: Tuple[int, int],
+    text_size: Tuple[int, int],
+    alignment: str,
+    position: str,
+    custom_position: Optional[Tuple[int, int]]
+) -> Tuple[int, int]:
+    """Calculate text position based on style."""
+    width, height = img_size
+    text_width, text_height = text_size
+    
+    # Horizontal alignment
+    if alignment == "left":
+        x = 50
+    elif alignment == "right":
+        x = width - text_width - 50
+    else:  # center
+        x = (width - text_width) // 2
+    
+    # Vertical position
+    if custom_position:
+        x, y = custom_position
+    elif position == "top":
+        y = 50
+    elif position == "middle":
+        y = (height - text_height) // 2
+    else:  # bottom
+        y = height - text_height - 50
+    
+    return x, y
+
+
+@functools.lru_cache(maxsize=256)
+def _background_bounds(
+    x: int, y: int,
+    width: int, height: int,
+    padding: int
+) -> Tuple[int, int, int, int]:
+    """Rectangle behind a text box, grown by padding on every side."""
+    return (x - padding, y - padding, x + width + padding, y + height + padding)
+
+
+def _blend_tile(frame: np.ndarray, tile: np.ndarray, x: int, y: int):
+    """Alpha-composite an RGBA tile onto an RGB/RGBA array in place."""
+    height, width = frame.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1 = min(x + tile.shape[1], width)
+    y1 = min(y + tile.shape[0], height)
+    if x1 <= x0 or y1 <= y0:
+        return
+    
+    src = tile[y0 - y:y1 - y, x0 - x:x1 - x].astype(np.float32)
+    region = frame[y0:y1, x0:x1]
+    alpha = src[..., 3:4] * (1.0 / 255.0)
+    
+    if frame.shape[2] == 3:
+        region[:] = src[..., :3] * alpha + region * (1.0 - alpha) + 0.5
+        return
+    
+    # Porter-Duff "over" for a destination that has its own alpha
+    dst = region.astype(np.float32)
+    dst_alpha = dst[..., 3:4] * (1.0 / 255.0) * (1.0 - alpha)
+    out_alpha = alpha + dst_alpha
+    rgb = (src[..., :3] * alpha + dst[..., :3] * dst_alpha) / np.maximum(out_alpha, 1e-6)
+    region[..., :3] = rgb + 0.5
+    region[..., 3:] = out_alpha * 255.0 + 0.5
+
+
 class TextOverlaySystem:
     """Advanced text overlay system for videos."""
     
+    # Font sizes used by the built-in templates and captions
+    PRELOAD_FONT_SIZES = (24, 36, 48, 72)
+    
     def __init__(self):
         """Initialize text overlay system."""
-        self.fonts_cache = {}
+        self.fonts_cache: Dict[Tuple[str, int], ImageFont.FreeTypeFont] = {}
+        self._typewriter_cache: Dict[Tuple[int, str], List[float]] = {}
         self._load_system_fonts()
+        
+        # Pre-warm the default family at the common sizes
+        for size in self.PRELOAD_FONT_SIZES:
+            self.get_font(TextStyle.font_family, size)
     
     def _load_system_fonts(self):
         """Load available system fonts."""
@@ -69,32 +218,49 @@ class TextOverlaySystem:
             "Trebuchet": "trebuc.ttf",
             "Calibri": "calibri.ttf"
         }
+        
+        # Resolve each family to the first matching file on disk once
+        self._font_paths: Dict[str, str] = {}
+        for family, font_file in self.available_fonts.items():
+            for font_dir in font_dirs:
+                font_path = os.path.abspath(os.path.join(font_dir, font_file))
+                if os.path.exists(font_path):
+                    self._font_paths[family] = font_path
+                    break
+        
+        # Keep the font files in memory so new sizes never hit the disk
+        self._font_bytes: Dict[str, bytes] = {}
+        for family, font_path in self._font_paths.items():
+            try:
+                with open(font_path, 'rb') as f:
+                    self._font_bytes[family] = f.read()
+            except OSError:
+                continue
     
     def get_font(self, font_family: str, size: int) -> ImageFont.FreeTypeFont:
         """Get or cache a font."""
-        cache_key = f"{font_family}_{size}"
-        
-        if cache_key not in self.fonts_cache:
-            font_file = self.available_fonts.get(font_family, "arial.ttf")
-            
-            # Try to load font
-            for font_dir in ["C:/Windows/Fonts/", "/System/Library/Fonts/", "./fonts/"]:
-                font_path = os.path.join(font_dir, font_file)
-                if os.path.exists(font_path):
-                    try:
-                        self.fonts_cache[cache_key] = ImageFont.truetype(font_path, size)
-                        break
-                    except:
-                        continue
-            
-            # Fallback to default font
-            if cache_key not in self.fonts_cache:
-                try:
-                    self.fonts_cache[cache_key] = ImageFont.truetype("arial.ttf", size)
-                except:
-                    self.fonts_cache[cache_key] = ImageFont.load_default()
-        
-        return self.fonts_cache[cache_key]
+        cache_key = (font_family, size)
+        font = self.fonts_cache.get(cache_key)
+        if font is not None:
+            return font
+        
+        # Unknown families fall back to Arial
+        font_data = self._font_bytes.get(font_family, self._font_bytes.get("Arial"))
+        if font_data is not None:
+            try:
+                font = ImageFont.truetype(io.BytesIO(font_data), size)
+            except OSError:
+                font = None
+        
+        # Fallback to default font
+        if font is None:
+            try:
+                font = ImageFont.truetype("arial.ttf", size)
+            except OSError:
+                font = ImageFont.load_default()
+        
+        self.fonts_cache[cache_key] = font
+        return font
     
     def add_text_overlay(
         self,
@@ -103,94 +269,218 @@ class TextOverlaySystem:
         style: TextStyle,
         progress: float = 1.0  # For animations
     ) -> Image.Image:
-        """Add text overlay to an image."""
-        # Create a copy
-        img = image.copy()
-        
-        # Create overlay layer with alpha
-        overlay = Image.new('RGBA', img.size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay)
+        """Add text overlay to an image.
         
+        Any input mode is accepted; the result is always RGBA so that
+        chained overlays skip the RGB round-trip.
+        """
+        return self.add_multiple_overlays(image, [(text, style, progress)])
+    
+    def add_multiple_overlays(
+        self,
+        image: Image.Image,
+        overlays: List[Tuple[str, TextStyle, float]]
+    ) -> Image.Image:
+        """Add several (text, style, progress) overlays with one composite."""
+        img = image if image.mode == 'RGBA' else image.convert('RGBA')
+        placed = [
+            (self._layout_text(img.size, text, style), progress)
+            for text, style, progress in overlays
+            if text
+        ]
+        return self._paste_precomputed(img, placed)
+    
+    def _paste_precomputed(
+        self,
+        image: Image.Image,
+        placed: List[Tuple[_TextLayout, float]]
+    ) -> Image.Image:
+        """Composite already laid-out overlays onto an RGBA image."""
+        tiles = []
+        for layout, progress in placed:
+            rendered = self._render_text_tile(image.size, layout, progress)
+            if rendered is not None:
+                tiles.append(rendered)
+        
+        # Nothing visible (empty text or fully transparent animation frame);
+        # still return a new image, never the caller's own
+        if not tiles:
+            return image.copy()
+        
+        # Blend every tile into one copy of the frame; only the tile
+        # regions are read and written
+        frame = np.array(image)
+        for tile_x, tile_y, tile in tiles:
+            _blend_tile(frame, np.asarray(tile), tile_x, tile_y)
+        
+        return Image.fromarray(frame)
+    
+    def _layout_text(
+        self,
+        img_size: Tuple[int, int],
+        text: str,
+        style: TextStyle
+    ) -> _TextLayout:
+        """Resolve font, text box and resting position for one overlay."""
         # Get font
         font = self.get_font(style.font_family, style.font_size)
         
         # Calculate text position
-        text_bbox = draw.textbbox((0, 0), text, font=font)
+        text_bbox = _MEASURE_DRAW.textbbox((0, 0), text, font=font)
         text_width = text_bbox[2] - text_bbox[0]
         text_height = text_bbox[3] - text_bbox[1]
         
-        x, y = self._calculate_position(
-            img.size, (text_width, text_height), style
+        x, y = _calculate_position(
+            img_size, (text_width, text_height),
+            style.alignment, style.position, style.custom_position
         )
         
+        return _TextLayout(text, style, font, x, y, text_bbox)
+    
+    def _render_text_tile(
+        self,
+        img_size: Tuple[int, int],
+        layout: _TextLayout,
+        progress: float
+    ) -> Optional[Tuple[int, int, Image.Image]]:
+        """Render one overlay into a tile just large enough to hold it.
+        
+        Returns None when the overlay would not be visible.
+        """
+        text, style, text_bbox = layout.text, layout.style, layout.text_bbox
+        if not text:
+            return None
+        
+        text_width = text_bbox[2] - text_bbox[0]
+        text_height = text_bbox[3] - text_bbox[1]
+        
         # Apply animation
         x, y, alpha = self._apply_animation(
-            x, y, style.animation, progress, img.size
+            layout.x, layout.y, style.animation, progress, img_size
         )
+        if alpha * 255 < 1:
+            return None
+        
+        # Typewriter reveals a prefix of the text at the full-text offset
+        reveal_width = text_width
+        if style.animation == "typewriter":
+            widths = self._typewriter_widths(text, layout.font)
+            visible = max(0, min(len(text), int(progress * len(text))))
+            if visible == 0:
+                return None
+            reveal_width = int(math.ceil(widths[visible]))
+            masks = self._text_masks(text[:visible], layout.font, style, text_bbox)
+        else:
+            # Glyph, stroke and shadow masks do not change between frames
+            if layout.masks is None:
+                layout.masks = self._text_masks(text, layout.font, style, text_bbox)
+            masks = layout.masks
+        glyph_mask, stroke_mask, shadow_mask = masks
+        
+        # Tile bounds: text plus stroke, shadow spread and background box
+        left = x + text_bbox[0]
+        top = y + text_bbox[1]
+        right = x + text_bbox[2]
+        bottom = y + text_bbox[3]
+        left -= style.stroke_width
+        top -= style.stroke_width
+        right += style.stroke_width
+        bottom += style.stroke_width
+        if style.shadow:
+            spread = int(math.ceil(style.shadow_blur * 3)) if style.shadow_blur > 0 else 0
+            left = min(left, left + style.shadow_offset[0] - spread)
+            top = min(top, top + style.shadow_offset[1] - spread)
+            right = max(right, right + style.shadow_offset[0] + spread)
+            bottom = max(bottom, bottom + style.shadow_offset[1] + spread)
+        if style.background:
+            padding = style.background_padding
+            left = min(left, x - padding)
+            top = min(top, y - padding)
+            right = max(right, x + text_width + padding + 1)
+            bottom = max(bottom, y + text_height + padding + 1)
+        
+        if right <= left or bottom <= top:
+            return None
+        
+        tile = Image.new('RGBA', (right - left, bottom - top), (0, 0, 0, 0))
+        tile_x, tile_y = x - left, y - top
         
         # Draw background if enabled
         if style.background:
             self._draw_text_background(
-                draw, x, y, text_width, text_height,
+                ImageDraw.Draw(tile), tile_x, tile_y, reveal_width, text_height,
                 style.background_color, style.background_padding
             )
         
         # Draw shadow if enabled
-        if style.shadow:
-            self._draw_text_shadow(
-                overlay, text, x, y, font, style
-            )
+        if shadow_mask is not None:
+            self._draw_text_shadow(tile, tile_x, tile_y, style, text_bbox, shadow_mask)
         
         # Draw main text with stroke
-        if style.stroke_width > 0:
-            # Draw stroke
-            for dx in range(-style.stroke_width, style.stroke_width + 1):
-                for dy in range(-style.stroke_width, style.stroke_width + 1):
-                    if dx != 0 or dy != 0:
-                        draw.text(
-                            (x + dx, y + dy), text,
-                            font=font, fill=style.stroke_color
-                        )
+        self._draw_stroked_text(
+            tile, tile_x, tile_y, style, alpha, text_bbox, glyph_mask, stroke_mask
+        )
         
-        # Draw main text
-        text_color = (*style.color, int(255 * alpha))
-        draw.text((x, y), text, font=font, fill=text_color)
+        return left, top, tile
+    
+    def _text_masks(
+        self,
+        text: str,
+        font: ImageFont.FreeTypeFont,
+        style: TextStyle,
+        text_bbox: Tuple[int, int, int, int]
+    ) -> Tuple[Image.Image, Optional[Image.Image], Optional[Image.Image]]:
+        """Render the glyph, stroke and shadow alpha masks for text.
+        
+        text_bbox is the box of the full text drawn at (0, 0); the glyph
+        and stroke masks start stroke_width before it, the shadow mask
+        starts the blur spread before the offset box.
+        """
+        left, top, right, bottom = text_bbox
+        
+        # Render the glyph once as an alpha mask
+        margin = max(0, style.stroke_width)
+        size = (right - left + 2 * margin, bottom - top + 2 * margin)
+        glyph_mask = Image.new('L', size, 0)
+        ImageDraw.Draw(glyph_mask).text(
+            (margin - left, margin - top), text, font=font, fill=255
+        )
+        
+        # Dilating the mask gives the union of every stroke offset in one pass
+        stroke_mask = None
+        if style.stroke_width > 0:
+            stroke_mask = glyph_mask.filter(
+                ImageFilter.MaxFilter(2 * style.stroke_width + 1)
+            )
         
-        # Composite overlay onto image
-        img = img.convert('RGBA')
-        img = Image.alpha_composite(img, overlay)
+        shadow_mask = None
+        if style.shadow:
+            # Only the glyph box plus the blur spread needs to be rendered
+            margin = int(math.ceil(style.shadow_blur * 3)) if style.shadow_blur > 0 else 0
+            size = (right - left + 2 * margin, bottom - top + 2 * margin)
+            shadow_mask = Image.new('L', size, 0)
+            ImageDraw.Draw(shadow_mask).text(
+                (margin - left, margin - top), text, font=font, fill=150
+            )
+            
+            # Blur shadow
+            if style.shadow_blur > 0:
+                shadow_mask = _blur_alpha(shadow_mask, style.shadow_blur)
         
-        return img.convert('RGB')
+        return glyph_mask, stroke_mask, shadow_mask
     
-    def _calculate_position(
+    def _typewriter_widths(
         self,
-        img_size: Tuple[int, int],
-        text_size: Tuple[int, int],
-        style: TextStyle
-    ) -> Tuple[int, int]:
-        """Calculate text position based on style."""
-        width, height = img_size
-        text_width, text_height = text_size
-        
-        # Horizontal alignment
-        if style.alignment == "left":
-            x = 50
-        elif style.alignment == "right":
-            x = width - text_width - 50
-        else:  # center
-            x = (width - text_width) // 2
-        
-        # Vertical position
-        if style.custom_position:
-            x, y = style.custom_position
-        elif style.position == "top":
-            y = 50
-        elif style.position == "middle":
-            y = (height - text_height) // 2
-        else:  # bottom
-            y = height - text_height - 50
-        
-        return x, y
+        text: str,
+        font: ImageFont.FreeTypeFont
+    ) -> List[float]:
+        """Cumulative advance widths, where entry k is the width of text[:k]."""
+        cache_key = (id(font), text)
+        widths = self._typewriter_cache.get(cache_key)
+        if widths is None:
+            widths = [0.0, *itertools.accumulate(font.getlength(ch) for ch in text)]
+            self._typewriter_cache[cache_key] = widths
+        return widths
     
     def _apply_animation(
         self,
@@ -209,8 +499,8 @@ class TextOverlaySystem:
             # Slide from bottom
             y = int(y + (height - y) * (1 - progress))
         elif animation == "typewriter":
-            # Simulate typewriter (would need character-by-character in real impl)
-            alpha = min(1.0, progress * 2)
+            # Characters are revealed in _render_text_tile; keep fully opaque
+            alpha = 1.0
         elif animation == "bounce":
             # Bounce effect
             import math
@@ -228,42 +518,46 @@ class TextOverlaySystem:
         padding: int
     ):
         """Draw background behind text."""
-        left = x - padding
-        top = y - padding
-        right = x + width + padding
-        bottom = y + height + padding
-        
-        draw.rectangle([left, top, right, bottom], fill=color)
+        draw.rectangle(_background_bounds(x, y, width, height, padding), fill=color)
     
-    def _draw_text_shadow(
+    def _draw_stroked_text(
         self,
         overlay: Image.Image,
-        text: str,
         x: int, y: int,
-        font: ImageFont.FreeTypeFont,
-        style: TextStyle
+        style: TextStyle,
+        alpha: float,
+        text_bbox: Tuple[int, int, int, int],
+        glyph_mask: Image.Image,
+        stroke_mask: Optional[Image.Image]
     ):
-        """Draw text shadow."""
-        # Create shadow layer
-        shadow_layer = Image.new('RGBA', overlay.size, (0, 0, 0, 0))
-        shadow_draw = ImageDraw.Draw(shadow_layer)
-        
-        # Draw shadow text
-        shadow_x = x + style.shadow_offset[0]
-        shadow_y = y + style.shadow_offset[1]
-        shadow_draw.text(
-            (shadow_x, shadow_y), text,
-            font=font, fill=(0, 0, 0, 150)
-        )
+        """Draw text and its outline from prerendered masks."""
+        tile_x = x + text_bbox[0] - style.stroke_width
+        tile_y = y + text_bbox[1] - style.stroke_width
         
-        # Blur shadow
-        if style.shadow_blur > 0:
-            shadow_layer = shadow_layer.filter(
-                ImageFilter.GaussianBlur(radius=style.shadow_blur)
-            )
+        if stroke_mask is not None:
+            overlay.paste((*style.stroke_color, 255), (tile_x, tile_y), stroke_mask)
         
-        # Composite shadow onto overlay
-        overlay.paste(shadow_layer, (0, 0), shadow_layer)
+        # Draw main text over the stroke, replacing it under the glyph
+        text_color = (*style.color, int(255 * alpha))
+        overlay.paste(text_color, (tile_x, tile_y), glyph_mask)
+    
+    def _draw_text_shadow(
+        self,
+        overlay: Image.Image,
+        x: int, y: int,
+        style: TextStyle,
+        text_bbox: Tuple[int, int, int, int],
+        shadow_mask: Image.Image
+    ):
+        """Draw text shadow from its prerendered, blurred mask."""
+        margin = int(math.ceil(style.shadow_blur * 3)) if style.shadow_blur > 0 else 0
+        tile_x = x + style.shadow_offset[0] + text_bbox[0] - margin
+        tile_y = y + style.shadow_offset[1] + text_bbox[1] - margin
+        
+        # Composite a solid black layer onto overlay through the mask
+        shadow_layer = Image.new('RGBA', shadow_mask.size, (0, 0, 0, 0))
+        shadow_layer.putalpha(shadow_mask)
+        overlay.paste(shadow_layer, (tile_x, tile_y), shadow_mask)
     
     def create_animated_title(
         self,
@@ -326,11 +620,9 @@ class TextOverlaySystem:
         social_handles: Dict[str, str] = None
     ) -> Image.Image:
         """Create end screen with call to action."""
-        img = background.copy()
-        
         # Darken background
-        overlay = Image.new('RGBA', img.size, (0, 0, 0, 180))
-        img = Image.alpha_composite(img.convert('RGBA'), overlay).convert('RGB')
+        overlay = Image.new('RGBA', background.size, (0, 0, 0, 180))
+        img = Image.alpha_composite(background.convert('RGBA'), overlay)
         
         # Add title
         title_style = TextStyle(
@@ -373,31 +665,51 @@ class TextOverlaySystem:
         captions: List[Caption],
         fps: int = 30
     ) -> List[Image.Image]:
-        """Apply captions to video frames."""
+        """Apply captions to video frames.
+        
+        Frames are returned as RGBA (converted only if they are not
+        already); the encoder converts them back to RGB.
+        """
         result_frames = []
         
+        # Text, font and resting position of each caption are fixed;
+        # only the animation progress changes from frame to frame
+        layouts: Dict[int, _TextLayout] = {}
+        
         for i, frame in enumerate(frames):
             current_time = i / fps
-            frame_with_captions = frame.copy()
+            frame_with_captions = (
+                frame if frame.mode == 'RGBA' else frame.convert('RGBA')
+            )
             
             # Find active captions
-            for caption in captions:
+            active = []
+            for index, caption in enumerate(captions):
                 if caption.start_time <= current_time <= caption.end_time:
                     # Calculate animation progress
                     caption_duration = caption.end_time - caption.start_time
                     caption_progress = (current_time - caption.start_time) / caption_duration
                     
-                    # Use caption style or default
-                    style = caption.style or TextStyle()
+                    layout = layouts.get(index)
+                    if layout is None:
+                        # Use caption style or default
+                        style = caption.style or TextStyle()
+                        layout = self._layout_text(
+                            frame_with_captions.size, caption.text, style
+                        )
+                        layouts[index] = layout
                     
-                    # Apply caption
-                    frame_with_captions = self.add_text_overlay(
-                        frame_with_captions,
-                        caption.text,
-                        style,
+                    active.append((
+                        layout,
                         min(1.0, caption_progress * 2)  # Fade in effect
-                    )
+                    ))
+            
+            # Draw every active caption, then composite once
+            if active:
+                frame_with_captions = self._paste_precomputed(
+                    frame_with_captions, active
+                )
             
             result_frames.append(frame_with_captions)
         
-        return result_frames
\ No newline at end of file
+        return result_frames
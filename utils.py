@@ -2,14 +2,22 @@
 Utility functions for YouTube Story Creator Pro
 """
 
+import functools
 import hashlib
-import json
 import os
 import tempfile
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
+import orjson
 import streamlit as st
 
+# Try to import tiktoken, but make it optional
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
 
 def get_user_hash(identifier: str = None) -> str:
     """Generate a unique hash for the user."""
@@ -23,8 +31,8 @@ def load_usage_tracker() -> Dict:
     tracker_file = 'usage_tracker.json'
     if os.path.exists(tracker_file):
         try:
-            with open(tracker_file, 'r') as f:
-                return json.load(f)
+            with open(tracker_file, 'rb') as f:
+                return orjson.loads(f.read())
         except Exception:
             return {}
     return {}
@@ -34,8 +42,8 @@ def save_usage_tracker(tracker: Dict) -> None:
     """Save usage tracking data."""
     tracker_file = 'usage_tracker.json'
     try:
-        with open(tracker_file, 'w') as f:
-            json.dump(tracker, f, indent=2)
+        with open(tracker_file, 'wb') as f:
+            f.write(orjson.dumps(tracker))
     except Exception as e:
         st.error(f"Failed to save usage tracker: {e}")
 
@@ -109,10 +117,33 @@ def validate_api_key(api_key: str) -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=1)
+def _get_token_encoding():
+    """Load the tokenizer once; None if tiktoken or its data is unavailable."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding('cl100k_base')
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _estimate_tokens_fast(text: str) -> int:
+    """Byte-length approximation: 1 token ≈ 4 bytes of UTF-8."""
+    return len(text.encode('utf-8', errors='ignore')) // 4
+
+
 def estimate_tokens(text: str) -> int:
-    """Rough estimation of token count."""
-    # Rough approximation: 1 token ≈ 4 characters
-    return len(text) // 4
+    """Estimate token count, exactly when tiktoken is installed."""
+    encoding = _get_token_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return _estimate_tokens_fast(text)
+
+
+# Characters that trip up text-to-speech engines
+_SPEECH_DEL = str.maketrans('', '', '<>{}[]#*')
 
 
 def sanitize_for_speech(text: str) -> str:
@@ -121,7 +152,6 @@ def sanitize_for_speech(text: str) -> str:
     import re
     text = re.sub(r'http[s]?://\S+', '', text)
     # Remove special characters that might cause issues
-    text = re.sub(r'[<>{}[\]#*]', '', text)
-    # Remove multiple spaces
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
\ No newline at end of file
+    text = text.translate(_SPEECH_DEL)
+    # Collapse whitespace runs and trim the ends
+    return ' '.join(text.split())
\ No newline at end of file
@@ -3,9 +3,13 @@ Advanced video effects and transitions module
 """
 
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance, ImageOps
+from PIL import Image, ImageFont, ImageFilter, ImageOps
 from typing import List, Tuple, Dict, Optional
+import functools
 import math
+import os
+import types
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 # Try to import cv2, but make it optional
@@ -15,8 +19,130 @@ try:
 except ImportError:
     CV2_AVAILABLE = False
 
+# Try to import numba, but make it optional
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
-@dataclass
+# Shared generator for grain and dissolve noise
+_RNG = np.random.default_rng()
+
+# ITU-R 601 luma weights, as used by PIL's "L" conversion
+_LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _hash32(x):
+        """Scramble a 32-bit integer (multiplicative hash + xorshift)."""
+        x = (x * 0x9E3779B1) & 0xFFFFFFFF
+        x ^= (x << 13) & 0xFFFFFFFF
+        x ^= x >> 17
+        x ^= (x << 5) & 0xFFFFFFFF
+        return x
+    
+    @njit(cache=True, parallel=True, fastmath=True, nogil=True)
+    def _dissolve_kernel(a, b, progress, seed):
+        """Pick each pixel from b with probability progress, else from a."""
+        height, width, channels = a.shape
+        out = np.empty_like(a)
+        threshold = progress * 16777216.0
+        for y in prange(height):
+            for x in range(width):
+                r = _hash32((y * width + x) ^ seed)
+                if (r & 0xFFFFFF) < threshold:
+                    for c in range(channels):
+                        out[y, x, c] = b[y, x, c]
+                else:
+                    for c in range(channels):
+                        out[y, x, c] = a[y, x, c]
+        return out
+    
+    @njit(cache=True, parallel=True, fastmath=True, nogil=True)
+    def _fused_effects(arr, out, lut, vignette_mask, grain, grain_scale,
+                       saturation, use_vignette, use_grain):
+        """Tone LUT, saturation, vignette and grain, reading each pixel once."""
+        height, width, _ = arr.shape
+        for y in prange(height):
+            for x in range(width):
+                r = np.float32(lut[arr[y, x, 0]])
+                g = np.float32(lut[arr[y, x, 1]])
+                b = np.float32(lut[arr[y, x, 2]])
+                
+                if saturation != 1.0:
+                    gray = 0.299 * r + 0.587 * g + 0.114 * b
+                    r = gray + (r - gray) * saturation
+                    g = gray + (g - gray) * saturation
+                    b = gray + (b - gray) * saturation
+                
+                if use_vignette:
+                    m = vignette_mask[y, x]
+                    r *= m
+                    g *= m
+                    b *= m
+                
+                if use_grain:
+                    r += grain[y, x, 0] * grain_scale
+                    g += grain[y, x, 1] * grain_scale
+                    b += grain[y, x, 2] * grain_scale
+                
+                out[y, x, 0] = np.uint8(min(max(r + 0.5, 0.0), 255.0))
+                out[y, x, 1] = np.uint8(min(max(g + 0.5, 0.0), 255.0))
+                out[y, x, 2] = np.uint8(min(max(b + 0.5, 0.0), 255.0))
+    
+    @njit(cache=True, parallel=True, fastmath=True, nogil=True)
+    def _fade_batch(a, b, progresses, out):
+        """Cross-fade flat buffers a into b, one output row per progress."""
+        n = a.shape[0]
+        for t in prange(progresses.shape[0]):
+            p = progresses[t]
+            for i in range(n):
+                va = np.float32(a[i])
+                out[t, i] = np.uint8(va + (np.float32(b[i]) - va) * p)
+
+    def _serial_build(kernel, name):
+        """Compile a parallel kernel's source again without parallel=True.
+        
+        The copy gets its own name, because Numba names its cache files
+        by qualname, and the parallel flag is not part of the cache key.
+        """
+        py_func = kernel.py_func
+        func = types.FunctionType(
+            py_func.__code__, py_func.__globals__, name,
+            py_func.__defaults__, py_func.__closure__
+        )
+        func.__qualname__ = name
+        return njit(cache=True, fastmath=True, nogil=True)(func)
+    
+    # Single-threaded effects for frames that are already spread over a
+    # thread pool (VideoEffects.process_frames). Launching parallel kernels
+    # from several threads at once aborts on Numba's workqueue threading
+    # layer, and would oversubscribe the cores on the others.
+    _fused_effects_serial = _serial_build(_fused_effects, '_fused_effects_serial')
+
+# Prefer the ahead-of-time build of the kernels (video_effects_kernels.py)
+# when it exists: it needs no JIT warmup, and no numba at runtime. Its
+# exports are serial, so fused_effects also serves the thread pool.
+try:
+    from ve_kernels import (
+        dissolve_kernel as _dissolve_kernel,
+        fused_effects as _fused_effects,
+        fused_effects as _fused_effects_serial,
+        fade_batch as _fade_batch,
+    )
+    AOT_KERNELS_AVAILABLE = True
+except ImportError:
+    AOT_KERNELS_AVAILABLE = False
+
+KERNELS_AVAILABLE = NUMBA_AVAILABLE or AOT_KERNELS_AVAILABLE
+
+# Frames rendered per _fade_batch call in VideoEffects._fade_sequence
+_FADE_CHUNK = 8
+
+
+@dataclass(frozen=True)
 class TransitionConfig:
     """Configuration for video transitions."""
     type: str  # fade, slide, zoom, wipe, dissolve, spin
@@ -24,7 +150,7 @@ class TransitionConfig:
     easing: str = "ease-in-out"  # linear, ease-in, ease-out, ease-in-out
 
 
-@dataclass
+@dataclass(frozen=True)
 class EffectConfig:
     """Configuration for video effects."""
     blur: float = 0.0
@@ -35,7 +161,7 @@ class EffectConfig:
     film_grain: float = 0.0
     
     
-@dataclass 
+@dataclass(frozen=True)
 class CameraMovement:
     """Configuration for camera movements."""
     type: str  # pan, zoom, ken_burns, rotate
@@ -46,6 +172,216 @@ class CameraMovement:
     duration: float = 3.0
 
 
+def _pick_resampler(delta: float) -> Image.Resampling:
+    """Choose a resampling filter for a relative size change of delta.
+    
+    Near-identity scales cannot show Lanczos' extra sharpness, so they
+    use the cheaper bilinear/bicubic kernels.
+    """
+    if delta < 0.02:
+        return Image.Resampling.BILINEAR
+    if delta < 0.2:
+        return Image.Resampling.BICUBIC
+    return Image.Resampling.LANCZOS
+
+
+# PIL filter -> OpenCV interpolation flag
+_CV2_INTERPOLATION = {
+    Image.Resampling.NEAREST: cv2.INTER_NEAREST,
+    Image.Resampling.BILINEAR: cv2.INTER_LINEAR,
+    Image.Resampling.BICUBIC: cv2.INTER_CUBIC,
+    Image.Resampling.LANCZOS: cv2.INTER_LANCZOS4,
+} if CV2_AVAILABLE else {}
+
+# Modes whose arrays OpenCV handles directly (1, 3 or 4 uint8 channels)
+_CV2_MODES = ('L', 'RGB', 'RGBA')
+
+
+def _resize(
+    img: Image.Image,
+    size: Tuple[int, int],
+    resample: Image.Resampling,
+    box: Optional[Tuple[int, int, int, int]] = None
+) -> Image.Image:
+    """Resize (optionally just the box region), via OpenCV when available."""
+    if not (CV2_AVAILABLE and img.mode in _CV2_MODES):
+        return img.resize(size, resample, box=box)
+    
+    arr = np.asarray(img)
+    if box is not None:
+        left, top, right, bottom = box
+        arr = arr[top:bottom, left:right]
+    
+    # OpenCV's Lanczos does not widen its support when shrinking, so use
+    # area averaging for downscales
+    if size[0] < arr.shape[1] and size[1] < arr.shape[0]:
+        interpolation = cv2.INTER_AREA
+    else:
+        interpolation = _CV2_INTERPOLATION[resample]
+    return Image.fromarray(cv2.resize(arr, size, interpolation=interpolation))
+
+
+def _gaussian_blur(img: Image.Image, sigma: float) -> Image.Image:
+    """Gaussian blur with standard deviation sigma."""
+    if CV2_AVAILABLE and img.mode in _CV2_MODES:
+        return Image.fromarray(cv2.GaussianBlur(np.asarray(img), (0, 0), sigma))
+    
+    if sigma > 5:
+        # Three box passes approximate a Gaussian (Wells, 1986); each
+        # pass carries a third of the variance, and a box of radius r
+        # has variance r * (r + 1) / 3
+        radius = max(1, int(round((math.sqrt(1 + 4 * sigma * sigma) - 1) / 2)))
+        for _ in range(3):
+            img = img.filter(ImageFilter.BoxBlur(radius))
+        return img
+    return img.filter(ImageFilter.GaussianBlur(radius=sigma))
+
+
+def _fast_rotate(
+    img: Image.Image,
+    angle: float,
+    resample: Image.Resampling = Image.Resampling.NEAREST
+) -> Image.Image:
+    """Rotate in place (expand=False), using transposes for right angles.
+    
+    Angles within half a degree of a quarter turn snap to it: a transpose
+    only reindexes pixels, while the affine path resamples every one.
+    Quarter turns of non-square images change their size, so only 0 and
+    180 take the shortcut there.
+    
+    Resampling defaults to nearest-neighbour: rotated frames are only
+    shown in motion or blended, where a smoother filter is not visible.
+    Callers that hold on a rotated frame can pass BICUBIC.
+    """
+    snapped = round(angle / 90.0) % 4
+    if abs(angle - round(angle / 90.0) * 90.0) < 0.5:
+        if snapped == 0:
+            return img.copy()
+        if snapped == 2:
+            return img.transpose(Image.Transpose.ROTATE_180)
+        if img.width == img.height:
+            return img.transpose(
+                Image.Transpose.ROTATE_90 if snapped == 1 else Image.Transpose.ROTATE_270
+            )
+    if CV2_AVAILABLE and img.mode in _CV2_MODES and resample != Image.Resampling.NEAREST:
+        # Only the filtered rotations are faster in OpenCV. PIL rotates
+        # about (w/2, h/2) in edge coordinates, i.e. about
+        # ((w-1)/2, (h-1)/2) in OpenCV's pixel-centre coordinates
+        center = ((img.width - 1) / 2, (img.height - 1) / 2)
+        matrix = cv2.getRotationMatrix2D(center, angle, 1.0)
+        return Image.fromarray(cv2.warpAffine(
+            np.asarray(img), matrix, img.size,
+            flags=_CV2_INTERPOLATION[resample],
+            borderMode=cv2.BORDER_CONSTANT, borderValue=0
+        ))
+    return img.rotate(angle, resample=resample, expand=False, fillcolor=(0, 0, 0))
+
+
+def _ease_linear(p):
+    return p
+
+
+def _ease_in_out(p):
+    if isinstance(p, np.ndarray):
+        return np.where(p < 0.5, 2 * p * p, 1 - 2 * (1 - p) ** 2)
+    return 2 * p * p if p < 0.5 else 1 - 2 * (1 - p) ** 2
+
+
+# Easing name -> curve; each accepts a float or an array of progress values
+_EASINGS = {
+    "linear": _ease_linear,
+    "ease-in": lambda p: p * p,
+    "ease-out": lambda p: 1 - (1 - p) ** 2,
+    "ease-in-out": _ease_in_out,
+}
+
+
+def _tone_lut(brightness: float, contrast: float) -> np.ndarray:
+    """256-entry table applying brightness, then contrast around mid-gray."""
+    levels = np.arange(256, dtype=np.float32) / 255.0
+    lut = ((levels * brightness - 0.5) * contrast + 0.5) * 255.0
+    return np.clip(lut + 0.5, 0, 255).astype(np.uint8)
+
+
+def _vignette_mask(width: int, height: int, strength: float) -> np.ndarray:
+    """Radial falloff from the centre, normalized to the frame's half-axes.
+    
+    Strength is rounded to two decimals so nearby values share one
+    cached (read-only) mask.
+    """
+    return _cached_vignette_mask(width, height, round(strength, 2))
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_vignette_mask(width: int, height: int, strength: float) -> np.ndarray:
+    yy, xx = np.ogrid[:height, :width]
+    dx = (xx - width / 2) / (width / 2)
+    dy = (yy - height / 2) / (height / 2)
+    r2 = dx * dx + dy * dy
+    mask = np.clip(1.0 - r2 * strength, 0.0, 1.0).astype(np.float32)
+    mask.flags.writeable = False
+    return mask
+
+
+# Film grain: one int8 Gaussian tile (std _GRAIN_STD) shared by all frames;
+# each frame reads it from a random offset instead of drawing new noise
+_GRAIN_TILE_SIZE = 512
+_GRAIN_STD = 32.0
+_GRAIN_TILE = np.clip(
+    _RNG.standard_normal((_GRAIN_TILE_SIZE, _GRAIN_TILE_SIZE, 3), dtype=np.float32) * _GRAIN_STD,
+    -127, 127
+).astype(np.int8)
+
+
+@functools.lru_cache(maxsize=4)
+def _grain_texture(height: int, width: int) -> np.ndarray:
+    """The grain tile repeated to cover a frame at any offset within one tile."""
+    reps = (height // _GRAIN_TILE_SIZE + 2, width // _GRAIN_TILE_SIZE + 2, 1)
+    texture = np.tile(_GRAIN_TILE, reps)
+    texture.flags.writeable = False
+    return texture
+
+
+def _grain_window(height: int, width: int) -> np.ndarray:
+    """A randomly offset height x width x 3 view of the grain texture."""
+    oy, ox = _RNG.integers(_GRAIN_TILE_SIZE, size=2)
+    return _grain_texture(height, width)[oy:oy + height, ox:ox + width]
+
+
+@dataclass
+class _Frame:
+    """Planar float32 RGB working buffer for multi-effect pipelines.
+    
+    Each channel is its own contiguous H x W plane, so per-channel
+    arithmetic runs over unit-stride memory; uint8 <-> float32
+    conversion happens only in from_pil/to_pil.
+    """
+    r: np.ndarray
+    g: np.ndarray
+    b: np.ndarray
+    
+    @classmethod
+    def from_pil(cls, img: Image.Image) -> "_Frame":
+        arr = np.asarray(img if img.mode == 'RGB' else img.convert('RGB'))
+        planes = np.moveaxis(arr, 2, 0).astype(np.float32, order='C')
+        return cls(planes[0], planes[1], planes[2])
+    
+    def planes(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return self.r, self.g, self.b
+    
+    def to_pil(self) -> Image.Image:
+        out = np.empty(self.r.shape + (3,), dtype=np.uint8)
+        for channel, plane in enumerate(self.planes()):
+            np.clip(plane + 0.5, 0, 255, out=plane)
+            out[..., channel] = plane
+        return Image.fromarray(out)
+
+
+def _is_still(frames: List[Image.Image]) -> bool:
+    """True when every entry is the same image object."""
+    return all(frame is frames[0] for frame in frames)
+
+
 class VideoEffects:
     """Advanced video effects processor."""
     
@@ -61,36 +397,93 @@ class VideoEffects:
         # Apply easing
         progress = VideoEffects._apply_easing(progress, transition.easing)
         
-        if transition.type == "fade":
+        return VideoEffects._transition_frame(img1, img2, transition.type, progress)
+    
+    @staticmethod
+    def _transition_frame(
+        img1: Image.Image,
+        img2: Image.Image,
+        transition_type: str,
+        progress: float  # already eased
+    ) -> Image.Image:
+        """Render one transition frame at an eased progress."""
+        if transition_type == "fade":
             return VideoEffects._fade_transition(img1, img2, progress)
-        elif transition.type == "slide":
+        elif transition_type == "slide":
             return VideoEffects._slide_transition(img1, img2, progress)
-        elif transition.type == "zoom":
+        elif transition_type == "zoom":
             return VideoEffects._zoom_transition(img1, img2, progress)
-        elif transition.type == "wipe":
+        elif transition_type == "wipe":
             return VideoEffects._wipe_transition(img1, img2, progress)
-        elif transition.type == "dissolve":
+        elif transition_type == "dissolve":
             return VideoEffects._dissolve_transition(img1, img2, progress)
-        elif transition.type == "spin":
+        elif transition_type == "spin":
             return VideoEffects._spin_transition(img1, img2, progress)
         else:
             return VideoEffects._fade_transition(img1, img2, progress)
     
     @staticmethod
-    def _apply_easing(progress: float, easing: str) -> float:
-        """Apply easing function to progress."""
-        if easing == "linear":
-            return progress
-        elif easing == "ease-in":
-            return progress * progress
-        elif easing == "ease-out":
-            return 1 - (1 - progress) ** 2
-        elif easing == "ease-in-out":
-            if progress < 0.5:
-                return 2 * progress * progress
-            else:
-                return 1 - 2 * (1 - progress) ** 2
-        return progress
+    def apply_transition_sequence(
+        frames1: List[Image.Image],
+        frames2: List[Image.Image],
+        transition: TransitionConfig
+    ) -> List[Image.Image]:
+        """Apply a transition across two frame sequences.
+        
+        Frame i blends frames1[i] into frames2[i] at progress i / n. Work
+        shared by every frame (easing, dissolve noise, wipe distance
+        field) is done once for the whole sequence. For a transition
+        between two stills, pass [img] * n for each side.
+        """
+        num_frames = min(len(frames1), len(frames2))
+        if num_frames == 0:
+            return []
+        
+        progresses = VideoEffects._apply_easing(
+            np.arange(num_frames) / num_frames, transition.easing
+        ).tolist()
+        width, height = frames1[0].size
+        
+        if transition.type == "dissolve":
+            # One noise field for the whole clip: each pixel flips exactly once
+            noise = _RNG.random((height, width), dtype=np.float32)
+            result = []
+            for img1, img2, progress in zip(frames1, frames2, progresses):
+                a, b = np.asarray(img1), np.asarray(img2)
+                chosen = noise < progress
+                if a.ndim == 3:
+                    chosen = chosen[..., None]
+                result.append(Image.fromarray(np.where(chosen, b, a)))
+            return result
+        
+        if transition.type == "wipe":
+            # Distance along the diagonal, thresholded per frame
+            yy, xx = np.ogrid[:height, :width]
+            diagonal = xx + yy
+            result = []
+            for img1, img2, progress in zip(frames1, frames2, progresses):
+                wipe_pos = int((width + height) * progress)
+                mask = Image.fromarray(
+                    np.where(diagonal <= wipe_pos, np.uint8(255), np.uint8(0))
+                )
+                result.append(Image.composite(img2, img1, mask))
+            return result
+        
+        if _is_still(frames1) and _is_still(frames2):
+            if transition.type == "slide":
+                return VideoEffects._slide_sequence(frames1[0], frames2[0], progresses)
+            if transition.type == "fade":
+                return VideoEffects._fade_sequence(frames1[0], frames2[0], progresses)
+        
+        return [
+            VideoEffects._transition_frame(img1, img2, transition.type, progress)
+            for img1, img2, progress in zip(frames1, frames2, progresses)
+        ]
+    
+    @staticmethod
+    def _apply_easing(progress, easing: str):
+        """Apply easing function to progress (a float or a NumPy array)."""
+        return _EASINGS.get(easing, _ease_linear)(progress)
     
     @staticmethod
     def _fade_transition(img1: Image.Image, img2: Image.Image, progress: float) -> Image.Image:
@@ -103,15 +496,52 @@ class VideoEffects:
         width = img1.width
         offset = int(width * progress)
         
-        result = Image.new('RGB', (width, img1.height))
-        
-        # Paste the sliding portions
-        if offset < width:
-            result.paste(img1.crop((offset, 0, width, img1.height)), (0, 0))
-        if offset > 0:
-            result.paste(img2.crop((0, 0, offset, img2.height)), (width - offset, 0))
-            
-        return result
+        # The visible window is the tail of img1 followed by the head of img2
+        a, b = np.asarray(img1), np.asarray(img2)
+        return Image.fromarray(np.concatenate((a[:, offset:], b[:, :offset]), axis=1))
+    
+    @staticmethod
+    def _slide_sequence(
+        img1: Image.Image,
+        img2: Image.Image,
+        progresses: List[float]
+    ) -> List[Image.Image]:
+        """Slide between two stills, one window of a side-by-side strip per frame."""
+        width = img1.width
+        combined = np.concatenate((np.asarray(img1), np.asarray(img2)), axis=1)
+        
+        frames = []
+        for progress in progresses:
+            offset = int(width * progress)
+            frames.append(Image.fromarray(
+                np.ascontiguousarray(combined[:, offset:offset + width])
+            ))
+        return frames
+    
+    @staticmethod
+    def _fade_sequence(
+        img1: Image.Image,
+        img2: Image.Image,
+        progresses: List[float]
+    ) -> List[Image.Image]:
+        """Fade between two stills, rendering a few frames per kernel call."""
+        a, b = np.asarray(img1), np.asarray(img2)
+        if not KERNELS_AVAILABLE or a.ndim != 3 or a.shape != b.shape:
+            return [VideoEffects._fade_transition(img1, img2, p) for p in progresses]
+        
+        a, b = a.ravel(), b.ravel()
+        progresses = np.asarray(progresses, dtype=np.float32)
+        # One small scratch buffer is reused across chunks; frombytes
+        # copies each row out, so peak memory is the frames plus the chunk
+        out = np.empty((min(len(progresses), _FADE_CHUNK), a.size), dtype=np.uint8)
+        frames = []
+        for start in range(0, len(progresses), _FADE_CHUNK):
+            chunk = progresses[start:start + _FADE_CHUNK]
+            _fade_batch(a, b, chunk, out[:len(chunk)])
+            frames.extend(
+                Image.frombytes(img1.mode, img1.size, row) for row in out[:len(chunk)]
+            )
+        return frames
     
     @staticmethod
     def _zoom_transition(img1: Image.Image, img2: Image.Image, progress: float) -> Image.Image:
@@ -124,8 +554,8 @@ class VideoEffects:
         new_size1 = (int(img1.width * scale1), int(img1.height * scale1))
         new_size2 = (int(img2.width * scale2), int(img2.height * scale2))
         
-        zoomed1 = img1.resize(new_size1, Image.Resampling.LANCZOS)
-        zoomed2 = img2.resize(new_size2, Image.Resampling.LANCZOS)
+        zoomed1 = _resize(img1, new_size1, _pick_resampler(abs(scale1 - 1.0)))
+        zoomed2 = _resize(img2, new_size2, _pick_resampler(abs(scale2 - 1.0)))
         
         # Center crop zoomed1
         left = (zoomed1.width - img1.width) // 2
@@ -151,14 +581,11 @@ class VideoEffects:
         """Diagonal wipe transition."""
         width, height = img1.size
         
-        # Create a gradient mask
-        mask = Image.new('L', (width, height), 0)
-        draw = ImageDraw.Draw(mask)
-        
-        # Diagonal wipe
+        # Diagonal wipe: everything above the anti-diagonal x + y = wipe_pos
         wipe_pos = int((width + height) * progress)
-        points = [(0, wipe_pos), (wipe_pos, 0), (0, 0)]
-        draw.polygon(points, fill=255)
+        yy, xx = np.ogrid[:height, :width]
+        mask_arr = np.where(xx + yy <= wipe_pos, np.uint8(255), np.uint8(0))
+        mask = Image.fromarray(mask_arr)
         
         # Apply mask
         result = Image.composite(img2, img1, mask)
@@ -167,15 +594,21 @@ class VideoEffects:
     @staticmethod
     def _dissolve_transition(img1: Image.Image, img2: Image.Image, progress: float) -> Image.Image:
         """Dissolve transition with noise."""
-        # Create noise mask
-        width, height = img1.size
-        noise = np.random.random((height, width))
-        mask = (noise < progress) * 255
-        mask_img = Image.fromarray(mask.astype(np.uint8), mode='L')
+        a = np.asarray(img1)
+        b = np.asarray(img2)
+        single_band = a.ndim == 2
+        if single_band:
+            a, b = a[..., None], b[..., None]
+        
+        if KERNELS_AVAILABLE:
+            # Fused noise + select in one parallel pass
+            seed = int(_RNG.integers(0, 2 ** 32))
+            result = _dissolve_kernel(a, b, float(progress), seed)
+        else:
+            noise = _RNG.random(a.shape[:2], dtype=np.float32)
+            result = np.where((noise < progress)[..., None], b, a)
         
-        # Apply mask
-        result = Image.composite(img2, img1, mask_img)
-        return result
+        return Image.fromarray(result[..., 0] if single_band else result)
     
     @staticmethod
     def _spin_transition(img1: Image.Image, img2: Image.Image, progress: float) -> Image.Image:
@@ -184,90 +617,148 @@ class VideoEffects:
         angle2 = (1 - progress) * 360
         
         # Rotate images
-        rotated1 = img1.rotate(angle1, expand=False, fillcolor=(0, 0, 0))
-        rotated2 = img2.rotate(angle2, expand=False, fillcolor=(0, 0, 0))
+        rotated1 = _fast_rotate(img1, angle1, Image.Resampling.NEAREST)
+        rotated2 = _fast_rotate(img2, angle2, Image.Resampling.NEAREST)
         
         # Blend
         return Image.blend(rotated1, rotated2, progress)
     
+    @staticmethod
+    def process_frames(
+        frames: List[Image.Image],
+        config: EffectConfig,
+        max_workers: Optional[int] = None
+    ) -> List[Image.Image]:
+        """Apply effects to many frames on a thread pool, keeping order.
+        
+        Most of the work is PIL, NumPy and OpenCV code that releases the
+        GIL. The fused Numba pass uses its single-threaded build here: the
+        pool already fills the cores, and parallel kernels must not be
+        launched from several threads at once. max_workers defaults to the
+        CPU count.
+        """
+        if len(frames) < 2:
+            return [VideoEffects.apply_effects(frame, config) for frame in frames]
+        
+        with ThreadPoolExecutor(max_workers or os.cpu_count()) as executor:
+            return list(executor.map(
+                lambda frame: VideoEffects._apply_effects(frame, config, serial=True),
+                frames
+            ))
+    
     @staticmethod
     def apply_effects(img: Image.Image, config: EffectConfig) -> Image.Image:
-        """Apply visual effects to an image."""
+        """Apply visual effects to an image.
+        
+        Blur runs first: it is spatial, and the per-pixel colour effects
+        that follow are (up to clipping) affine, so the order barely
+        matters and the colour effects can then be fused into one pass.
+        """
+        return VideoEffects._apply_effects(img, config, serial=False)
+    
+    @staticmethod
+    def _apply_effects(img: Image.Image, config: EffectConfig, serial: bool) -> Image.Image:
+        """apply_effects, choosing the serial or parallel fused kernel."""
         result = img.copy()
         
-        # Brightness
-        if config.brightness != 1.0:
-            enhancer = ImageEnhance.Brightness(result)
-            result = enhancer.enhance(config.brightness)
+        # Blur
+        if config.blur > 0:
+            result = _gaussian_blur(result, config.blur)
+        
+        if (config.brightness == 1.0 and config.contrast == 1.0
+                and config.saturation == 1.0
+                and config.vignette <= 0 and config.film_grain <= 0):
+            return result
+        
+        lut = _tone_lut(config.brightness, config.contrast)
+        
+        if KERNELS_AVAILABLE and result.mode == 'RGB':
+            # Tone, saturation, vignette and grain in a single pass
+            arr = np.asarray(result)
+            height, width = arr.shape[:2]
+            use_vignette = config.vignette > 0
+            use_grain = config.film_grain > 0
+            vignette_mask = (
+                _vignette_mask(width, height, config.vignette) if use_vignette
+                else np.ones((1, 1), dtype=np.float32)
+            )
+            grain = (
+                _grain_window(height, width) if use_grain
+                else np.zeros((1, 1, 3), dtype=np.int8)
+            )
+            out = np.empty_like(arr)
+            kernel = _fused_effects_serial if serial else _fused_effects
+            kernel(
+                arr, out, lut, vignette_mask, grain,
+                np.float32(config.film_grain * 25.0 / _GRAIN_STD),
+                np.float32(config.saturation), use_vignette, use_grain
+            )
+            return Image.fromarray(out)
+        
+        # Brightness and contrast (pivoting on mid-gray) as one lookup table
+        if config.brightness != 1.0 or config.contrast != 1.0:
+            result = result.point(lut.tolist() * len(result.getbands()))
+        
+        if config.saturation == 1.0 and config.vignette <= 0 and config.film_grain <= 0:
+            return result
         
-        # Contrast
-        if config.contrast != 1.0:
-            enhancer = ImageEnhance.Contrast(result)
-            result = enhancer.enhance(config.contrast)
+        # Remaining effects run on one planar float32 buffer
+        frame = _Frame.from_pil(result)
         
         # Saturation
         if config.saturation != 1.0:
-            enhancer = ImageEnhance.Color(result)
-            result = enhancer.enhance(config.saturation)
-        
-        # Blur
-        if config.blur > 0:
-            result = result.filter(ImageFilter.GaussianBlur(radius=config.blur))
+            VideoEffects._apply_saturation(frame, config.saturation)
         
         # Vignette
         if config.vignette > 0:
-            result = VideoEffects._apply_vignette(result, config.vignette)
+            VideoEffects._apply_vignette(frame, config.vignette)
         
         # Film grain
         if config.film_grain > 0:
-            result = VideoEffects._apply_film_grain(result, config.film_grain)
+            VideoEffects._apply_film_grain(frame, config.film_grain)
         
-        return result
+        return frame.to_pil()
     
     @staticmethod
-    def _apply_vignette(img: Image.Image, strength: float) -> Image.Image:
-        """Apply vignette effect."""
-        width, height = img.size
-        
-        # Create radial gradient
-        vignette = Image.new('L', (width, height), 255)
-        draw = ImageDraw.Draw(vignette)
-        
-        # Draw concentric ellipses
-        for i in range(255, 0, -2):
-            alpha = int(255 - (255 - i) * strength)
-            border = int(min(width, height) * (i / 255) * 0.7)
-            draw.ellipse(
-                [(width//2 - border, height//2 - border),
-                 (width//2 + border, height//2 + border)],
-                fill=alpha
-            )
-        
-        # Apply vignette
-        result = Image.new('RGB', (width, height))
-        result.paste(img, (0, 0))
-        result.putalpha(vignette)
-        
-        # Composite with black background
-        black_bg = Image.new('RGB', (width, height), (0, 0, 0))
-        result = Image.alpha_composite(black_bg.convert('RGBA'), result.convert('RGBA'))
-        
-        return result.convert('RGB')
+    def _apply_saturation(frame: _Frame, saturation: float) -> _Frame:
+        """Mix each pixel with its luma, in place."""
+        weights = _LUMA_WEIGHTS
+        gray = frame.r * weights[0]
+        gray += frame.g * weights[1]
+        gray += frame.b * weights[2]
+        
+        for plane in frame.planes():
+            np.subtract(plane, gray, out=plane)
+            np.multiply(plane, saturation, out=plane)
+            np.add(plane, gray, out=plane)
+        
+        return frame
     
     @staticmethod
-    def _apply_film_grain(img: Image.Image, strength: float) -> Image.Image:
-        """Apply film grain effect."""
-        # Convert to numpy array
-        img_array = np.array(img)
+    def _apply_vignette(frame: _Frame, strength: float) -> _Frame:
+        """Apply vignette effect, in place."""
+        height, width = frame.r.shape
+        mask = _vignette_mask(width, height, strength)
         
-        # Generate noise
-        noise = np.random.normal(0, strength * 25, img_array.shape)
+        # Darken towards black
+        for plane in frame.planes():
+            np.multiply(plane, mask, out=plane)
         
-        # Add noise
-        noisy = img_array + noise
-        noisy = np.clip(noisy, 0, 255).astype(np.uint8)
-        
-        return Image.fromarray(noisy)
+        return frame
+    
+    @staticmethod
+    def _apply_film_grain(frame: _Frame, strength: float) -> _Frame:
+        """Apply film grain effect, in place."""
+        height, width = frame.r.shape
+        grain = _grain_window(height, width)
+        scale = np.float32(strength * 25.0 / _GRAIN_STD)
+        
+        for channel, plane in enumerate(frame.planes()):
+            noise = grain[..., channel].astype(np.float32)
+            np.multiply(noise, scale, out=noise)
+            np.add(plane, noise, out=plane)
+        
+        return frame
     
     @staticmethod
     def apply_camera_movement(
@@ -317,11 +808,13 @@ class VideoEffects:
         right = min(width, left + crop_width)
         bottom = min(height, top + crop_height)
         
-        # Crop and resize
-        cropped = img.crop((int(left), int(top), int(right), int(bottom)))
-        result = cropped.resize((width, height), Image.Resampling.LANCZOS)
-        
-        return result
+        # Crop and resize in one pass: resize reads straight from the box
+        # instead of materializing a cropped copy first
+        resampler = _pick_resampler(abs(crop_width - width) / width)
+        return _resize(
+            img, (width, height), resampler,
+            box=(int(left), int(top), int(right), int(bottom))
+        )
     
     @staticmethod
     def _pan_effect(
@@ -333,24 +826,23 @@ class VideoEffects:
         current_x = movement.start_pos[0] + (movement.end_pos[0] - movement.start_pos[0]) * progress
         current_y = movement.start_pos[1] + (movement.end_pos[1] - movement.start_pos[1]) * progress
         
-        # Create a larger canvas
+        # Shift the image by the pan offset onto a black frame
         width, height = img.size
-        canvas_width = int(width * 1.5)
-        canvas_height = int(height * 1.5)
-        
-        canvas = Image.new('RGB', (canvas_width, canvas_height), (0, 0, 0))
+        src = np.asarray(img if img.mode == 'RGB' else img.convert('RGB'))
+        out = np.zeros_like(src)
         
-        # Paste image at position
-        paste_x = int((canvas_width - width) / 2 + (current_x - 0.5) * width)
-        paste_y = int((canvas_height - height) / 2 + (current_y - 0.5) * height)
-        canvas.paste(img, (paste_x, paste_y))
+        dx = math.floor((current_x - 0.5) * width)
+        dy = math.floor((current_y - 0.5) * height)
         
-        # Crop to original size
-        crop_left = (canvas_width - width) // 2
-        crop_top = (canvas_height - height) // 2
-        result = canvas.crop((crop_left, crop_top, crop_left + width, crop_top + height))
+        # Overlap of the shifted source with the output
+        src_x, src_y = max(0, -dx), max(0, -dy)
+        dst_x, dst_y = max(0, dx), max(0, dy)
+        w = width - max(src_x, dst_x)
+        h = height - max(src_y, dst_y)
+        if w > 0 and h > 0:
+            out[dst_y:dst_y + h, dst_x:dst_x + w] = src[src_y:src_y + h, src_x:src_x + w]
         
-        return result
+        return Image.fromarray(out)
     
     @staticmethod
     def _zoom_effect(
@@ -366,7 +858,7 @@ class VideoEffects:
         new_height = int(height * current_scale)
         
         # Resize
-        resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        resized = _resize(img, (new_width, new_height), _pick_resampler(abs(current_scale - 1.0)))
         
         # Center crop or pad
         if current_scale > 1.0:
@@ -394,6 +886,6 @@ class VideoEffects:
         angle = movement.start_scale + (movement.end_scale - movement.start_scale) * progress
         
         # Rotate
-        rotated = img.rotate(angle, expand=False, fillcolor=(0, 0, 0))
+        rotated = _fast_rotate(img, angle, Image.Resampling.NEAREST)
         
         return rotated
\ No newline at end of file
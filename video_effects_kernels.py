@@ -0,0 +1,44 @@
+"""
+Ahead-of-time build of the video effect Numba kernels
+
+Run ``python video_effects_kernels.py`` once per platform to compile the
+kernels from video_effects.py into the ``ve_kernels`` extension module
+next to this file. video_effects imports it when present, which skips
+JIT compilation on the first frame of a fresh process; without it the
+@njit versions are used as before.
+
+AOT exports are compiled without ``parallel=True``, so each kernel runs
+on one thread; VideoEffects.process_frames spreads frames across cores.
+"""
+
+import os
+import sys
+
+from numba.pycc import CC
+
+# Build from the @njit sources even if an older ve_kernels is importable
+sys.modules['ve_kernels'] = None
+import video_effects
+
+cc = CC('ve_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export(
+    'dissolve_kernel',
+    'uint8[:,:,:](uint8[:,:,:], uint8[:,:,:], float64, int64)'
+)(video_effects._dissolve_kernel.py_func)
+
+cc.export(
+    'fused_effects',
+    'void(uint8[:,:,:], uint8[:,:,:], uint8[:], float32[:,:], int8[:,:,:], '
+    'float32, float32, boolean, boolean)'
+)(video_effects._fused_effects.py_func)
+
+cc.export(
+    'fade_batch',
+    'void(uint8[:], uint8[:], float32[:], uint8[:,:])'
+)(video_effects._fade_batch.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -2,26 +2,34 @@
 Video templates and music management system
 """
 
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Dict, Mapping, Optional, Tuple
+from types import MappingProxyType
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import hashlib
+import importlib.util
+import math
 import os
-import requests
+import shutil
+import subprocess
+import tempfile
 import numpy as np
-from PIL import Image
-import io
+from io import BytesIO
 
-# Try to import pydub, but make it optional
-try:
-    from pydub import AudioSegment
-    PYDUB_AVAILABLE = True
-except ImportError:
-    PYDUB_AVAILABLE = False
+# Optional audio backends and requests are only imported when music is
+# actually fetched or mixed; find_spec checks for them without importing
+SOUNDFILE_AVAILABLE = importlib.util.find_spec("soundfile") is not None
+SOXR_AVAILABLE = importlib.util.find_spec("soxr") is not None
 
-from video_effects import VideoEffects, TransitionConfig, EffectConfig, CameraMovement
-from text_overlays import TextOverlaySystem, TextStyle, Caption
+from video_effects import TransitionConfig, EffectConfig, CameraMovement
+from text_overlays import TextStyle
 
+if TYPE_CHECKING:
+    import requests
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class MusicTrack:
     """Background music configuration."""
     file_path: Optional[str] = None
@@ -33,7 +41,7 @@ class MusicTrack:
     genre: str = "ambient"
 
 
-@dataclass 
+@dataclass(frozen=True, slots=True)
 class SoundEffect:
     """Sound effect configuration."""
     name: str  # whoosh, impact, rise, etc.
@@ -41,7 +49,7 @@ class SoundEffect:
     volume: float = 0.5
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VideoTemplate:
     """Pre-configured video template."""
     name: str
@@ -49,17 +57,186 @@ class VideoTemplate:
     transitions: List[TransitionConfig]
     effects: EffectConfig
     camera_movements: List[CameraMovement]
-    text_styles: Dict[str, TextStyle]
+    text_styles: Mapping[str, TextStyle]
     music_genre: str
     color_scheme: Dict[str, Tuple[int, int, int]]
+    # color_scheme as one (n, 3) uint8 array, and each name's row in it
+    color_scheme_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    color_index: Dict[str, int] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen, so derived fields are set through object.__setattr__
+        colors = np.asarray(list(self.color_scheme.values()), dtype=np.uint8).reshape(-1, 3)
+        colors.flags.writeable = False
+        object.__setattr__(self, "color_scheme_arr", colors)
+        object.__setattr__(
+            self, "color_index", {name: row for row, name in enumerate(self.color_scheme)}
+        )
+
+
+# Per-template text styles, built once at import and read-only so the
+# shared templates cannot be modified through them
+_CINEMATIC_TEXT_STYLES: Mapping[str, TextStyle] = MappingProxyType({
+    "title": TextStyle(
+        font_family="Impact",
+        font_size=72,
+        color=(255, 255, 255),
+        stroke_width=3,
+        shadow=True,
+        animation="fade"
+    ),
+    "subtitle": TextStyle(
+        font_family="Arial",
+        font_size=36,
+        color=(230, 230, 230),
+        position="bottom"
+    )
+})
+
+
+_DOCUMENTARY_TEXT_STYLES: Mapping[str, TextStyle] = MappingProxyType({
+    "title": TextStyle(
+        font_family="Georgia",
+        font_size=48,
+        color=(255, 255, 255),
+        background=True,
+        background_color=(0, 0, 0, 200)
+    ),
+    "caption": TextStyle(
+        font_family="Verdana",
+        font_size=28,
+        color=(255, 255, 255),
+        position="bottom",
+        background=True
+    )
+})
+
+
+_SOCIAL_MEDIA_TEXT_STYLES: Mapping[str, TextStyle] = MappingProxyType({
+    "title": TextStyle(
+        font_family="Arial Bold",
+        font_size=64,
+        color=(255, 255, 0),
+        stroke_width=4,
+        stroke_color=(255, 0, 255),
+        animation="bounce"
+    ),
+    "hashtag": TextStyle(
+        font_family="Arial",
+        font_size=32,
+        color=(0, 255, 255),
+        position="top"
+    )
+})
+
+
+_MOTIVATIONAL_TEXT_STYLES: Mapping[str, TextStyle] = MappingProxyType({
+    "quote": TextStyle(
+        font_family="Georgia",
+        font_size=56,
+        color=(255, 255, 255),
+        shadow=True,
+        position="middle",
+        animation="fade"
+    ),
+    "author": TextStyle(
+        font_family="Times New Roman",
+        font_size=32,
+        color=(255, 215, 0),
+        position="bottom"
+    )
+})
+
+
+_EDUCATIONAL_TEXT_STYLES: Mapping[str, TextStyle] = MappingProxyType({
+    "title": TextStyle(
+        font_family="Calibri",
+        font_size=48,
+        color=(0, 0, 0),
+        background=True,
+        background_color=(255, 255, 255, 230),
+        position="top"
+    ),
+    "bullet": TextStyle(
+        font_family="Arial",
+        font_size=32,
+        color=(0, 0, 0),
+        background=True,
+        background_color=(255, 255, 200, 200),
+        alignment="left"
+    )
+})
+
+
+_NEWS_TEXT_STYLES: Mapping[str, TextStyle] = MappingProxyType({
+    "headline": TextStyle(
+        font_family="Arial Bold",
+        font_size=54,
+        color=(255, 255, 255),
+        background=True,
+        background_color=(200, 0, 0, 230),
+        position="bottom"
+    ),
+    "ticker": TextStyle(
+        font_family="Arial",
+        font_size=24,
+        color=(255, 255, 255),
+        background=True,
+        background_color=(0, 0, 0, 200),
+        position="bottom"
+    )
+})
+
+
+_STORYTELLING_TEXT_STYLES: Mapping[str, TextStyle] = MappingProxyType({
+    "narration": TextStyle(
+        font_family="Georgia",
+        font_size=42,
+        color=(255, 248, 220),  # Cornsilk
+        shadow=True,
+        position="bottom",
+        animation="typewriter"
+    ),
+    "chapter": TextStyle(
+        font_family="Times New Roman",
+        font_size=64,
+        color=(255, 255, 255),
+        position="middle",
+        animation="fade"
+    )
+})
+
+
+_MINIMAL_TEXT_STYLES: Mapping[str, TextStyle] = MappingProxyType({
+    "title": TextStyle(
+        font_family="Arial",
+        font_size=48,
+        color=(50, 50, 50),
+        position="middle",
+        animation="fade"
+    ),
+    "subtitle": TextStyle(
+        font_family="Arial",
+        font_size=28,
+        color=(100, 100, 100),
+        position="bottom"
+    )
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _intern(config):
+    """Canonical instance of a frozen config: equal configs share one object."""
+    return config
 
 
 class VideoTemplateLibrary:
     """Library of pre-made video templates."""
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_templates() -> Dict[str, VideoTemplate]:
-        """Get all available templates."""
+        """Get all available templates (built once, shared; do not mutate)."""
         return {
             "cinematic": VideoTemplateLibrary._cinematic_template(),
             "documentary": VideoTemplateLibrary._documentary_template(),
@@ -78,34 +255,19 @@ class VideoTemplateLibrary:
             name="Cinematic",
             description="Hollywood-style with dramatic effects",
             transitions=[
-                TransitionConfig("fade", 1.5, "ease-in-out"),
-                TransitionConfig("zoom", 1.0, "ease-in")
+                _intern(TransitionConfig("fade", 1.5, "ease-in-out")),
+                _intern(TransitionConfig("zoom", 1.0, "ease-in"))
             ],
-            effects=EffectConfig(
+            effects=_intern(EffectConfig(
                 contrast=1.3,
                 saturation=0.9,
                 vignette=0.3,
                 film_grain=0.1
-            ),
+            )),
             camera_movements=[
-                CameraMovement("ken_burns", (0.4, 0.4), (0.6, 0.6), 1.0, 1.3, 5.0)
+                _intern(CameraMovement("ken_burns", (0.4, 0.4), (0.6, 0.6), 1.0, 1.3, 5.0))
             ],
-            text_styles={
-                "title": TextStyle(
-                    font_family="Impact",
-                    font_size=72,
-                    color=(255, 255, 255),
-                    stroke_width=3,
-                    shadow=True,
-                    animation="fade"
-                ),
-                "subtitle": TextStyle(
-                    font_family="Arial",
-                    font_size=36,
-                    color=(230, 230, 230),
-                    position="bottom"
-                )
-            },
+            text_styles=_CINEMATIC_TEXT_STYLES,
             music_genre="epic",
             color_scheme={
                 "primary": (255, 215, 0),  # Gold
@@ -121,33 +283,18 @@ class VideoTemplateLibrary:
             name="Documentary",
             description="Authentic, informative style",
             transitions=[
-                TransitionConfig("fade", 0.5, "linear"),
-                TransitionConfig("wipe", 0.8, "ease-out")
+                _intern(TransitionConfig("fade", 0.5, "linear")),
+                _intern(TransitionConfig("wipe", 0.8, "ease-out"))
             ],
-            effects=EffectConfig(
+            effects=_intern(EffectConfig(
                 contrast=1.0,
                 saturation=0.95,
                 brightness=1.05
-            ),
+            )),
             camera_movements=[
-                CameraMovement("pan", (0.3, 0.5), (0.7, 0.5), 1.0, 1.0, 4.0)
+                _intern(CameraMovement("pan", (0.3, 0.5), (0.7, 0.5), 1.0, 1.0, 4.0))
             ],
-            text_styles={
-                "title": TextStyle(
-                    font_family="Georgia",
-                    font_size=48,
-                    color=(255, 255, 255),
-                    background=True,
-                    background_color=(0, 0, 0, 200)
-                ),
-                "caption": TextStyle(
-                    font_family="Verdana",
-                    font_size=28,
-                    color=(255, 255, 255),
-                    position="bottom",
-                    background=True
-                )
-            },
+            text_styles=_DOCUMENTARY_TEXT_STYLES,
             music_genre="ambient",
             color_scheme={
                 "primary": (255, 255, 255),
@@ -163,33 +310,18 @@ class VideoTemplateLibrary:
             name="Social Media",
             description="Eye-catching, fast-paced for social platforms",
             transitions=[
-                TransitionConfig("slide", 0.3, "ease-out"),
-                TransitionConfig("spin", 0.5, "ease-in-out")
+                _intern(TransitionConfig("slide", 0.3, "ease-out")),
+                _intern(TransitionConfig("spin", 0.5, "ease-in-out"))
             ],
-            effects=EffectConfig(
+            effects=_intern(EffectConfig(
                 contrast=1.4,
                 saturation=1.3,
                 brightness=1.1
-            ),
+            )),
             camera_movements=[
-                CameraMovement("zoom", (0.5, 0.5), (0.5, 0.5), 1.0, 1.2, 2.0)
+                _intern(CameraMovement("zoom", (0.5, 0.5), (0.5, 0.5), 1.0, 1.2, 2.0))
             ],
-            text_styles={
-                "title": TextStyle(
-                    font_family="Arial Bold",
-                    font_size=64,
-                    color=(255, 255, 0),
-                    stroke_width=4,
-                    stroke_color=(255, 0, 255),
-                    animation="bounce"
-                ),
-                "hashtag": TextStyle(
-                    font_family="Arial",
-                    font_size=32,
-                    color=(0, 255, 255),
-                    position="top"
-                )
-            },
+            text_styles=_SOCIAL_MEDIA_TEXT_STYLES,
             music_genre="upbeat",
             color_scheme={
                 "primary": (255, 0, 255),  # Magenta
@@ -205,34 +337,19 @@ class VideoTemplateLibrary:
             name="Motivational",
             description="Uplifting and inspirational style",
             transitions=[
-                TransitionConfig("fade", 1.0, "ease-in-out"),
-                TransitionConfig("dissolve", 1.2, "ease-in")
+                _intern(TransitionConfig("fade", 1.0, "ease-in-out")),
+                _intern(TransitionConfig("dissolve", 1.2, "ease-in"))
             ],
-            effects=EffectConfig(
+            effects=_intern(EffectConfig(
                 contrast=1.2,
                 saturation=1.1,
                 brightness=1.15,
                 vignette=0.2
-            ),
+            )),
             camera_movements=[
-                CameraMovement("ken_burns", (0.5, 0.5), (0.5, 0.5), 1.0, 1.4, 6.0)
+                _intern(CameraMovement("ken_burns", (0.5, 0.5), (0.5, 0.5), 1.0, 1.4, 6.0))
             ],
-            text_styles={
-                "quote": TextStyle(
-                    font_family="Georgia",
-                    font_size=56,
-                    color=(255, 255, 255),
-                    shadow=True,
-                    position="middle",
-                    animation="fade"
-                ),
-                "author": TextStyle(
-                    font_family="Times New Roman",
-                    font_size=32,
-                    color=(255, 215, 0),
-                    position="bottom"
-                )
-            },
+            text_styles=_MOTIVATIONAL_TEXT_STYLES,
             music_genre="inspirational",
             color_scheme={
                 "primary": (255, 215, 0),  # Gold
@@ -248,35 +365,18 @@ class VideoTemplateLibrary:
             name="Educational",
             description="Clear, informative style for learning",
             transitions=[
-                TransitionConfig("wipe", 0.5, "linear"),
-                TransitionConfig("fade", 0.7, "ease-out")
+                _intern(TransitionConfig("wipe", 0.5, "linear")),
+                _intern(TransitionConfig("fade", 0.7, "ease-out"))
             ],
-            effects=EffectConfig(
+            effects=_intern(EffectConfig(
                 contrast=1.1,
                 saturation=1.0,
                 brightness=1.1
-            ),
+            )),
             camera_movements=[
-                CameraMovement("pan", (0.2, 0.5), (0.8, 0.5), 1.0, 1.0, 5.0)
+                _intern(CameraMovement("pan", (0.2, 0.5), (0.8, 0.5), 1.0, 1.0, 5.0))
             ],
-            text_styles={
-                "title": TextStyle(
-                    font_family="Calibri",
-                    font_size=48,
-                    color=(0, 0, 0),
-                    background=True,
-                    background_color=(255, 255, 255, 230),
-                    position="top"
-                ),
-                "bullet": TextStyle(
-                    font_family="Arial",
-                    font_size=32,
-                    color=(0, 0, 0),
-                    background=True,
-                    background_color=(255, 255, 200, 200),
-                    alignment="left"
-                )
-            },
+            text_styles=_EDUCATIONAL_TEXT_STYLES,
             music_genre="background",
             color_scheme={
                 "primary": (0, 120, 215),  # Blue
@@ -292,32 +392,15 @@ class VideoTemplateLibrary:
             name="News",
             description="Professional news broadcast style",
             transitions=[
-                TransitionConfig("wipe", 0.3, "linear")
+                _intern(TransitionConfig("wipe", 0.3, "linear"))
             ],
-            effects=EffectConfig(
+            effects=_intern(EffectConfig(
                 contrast=1.1,
                 saturation=0.9,
                 brightness=1.0
-            ),
+            )),
             camera_movements=[],  # Static for news
-            text_styles={
-                "headline": TextStyle(
-                    font_family="Arial Bold",
-                    font_size=54,
-                    color=(255, 255, 255),
-                    background=True,
-                    background_color=(200, 0, 0, 230),
-                    position="bottom"
-                ),
-                "ticker": TextStyle(
-                    font_family="Arial",
-                    font_size=24,
-                    color=(255, 255, 255),
-                    background=True,
-                    background_color=(0, 0, 0, 200),
-                    position="bottom"
-                )
-            },
+            text_styles=_NEWS_TEXT_STYLES,
             music_genre="news",
             color_scheme={
                 "primary": (200, 0, 0),  # Red
@@ -333,36 +416,20 @@ class VideoTemplateLibrary:
             name="Storytelling",
             description="Engaging narrative style",
             transitions=[
-                TransitionConfig("fade", 1.2, "ease-in-out"),
-                TransitionConfig("dissolve", 1.0, "ease-in")
+                _intern(TransitionConfig("fade", 1.2, "ease-in-out")),
+                _intern(TransitionConfig("dissolve", 1.0, "ease-in"))
             ],
-            effects=EffectConfig(
+            effects=_intern(EffectConfig(
                 contrast=1.15,
                 saturation=1.05,
                 brightness=1.0,
                 film_grain=0.05,
                 vignette=0.25
-            ),
+            )),
             camera_movements=[
-                CameraMovement("ken_burns", (0.3, 0.3), (0.7, 0.7), 1.1, 1.2, 4.0)
+                _intern(CameraMovement("ken_burns", (0.3, 0.3), (0.7, 0.7), 1.1, 1.2, 4.0))
             ],
-            text_styles={
-                "narration": TextStyle(
-                    font_family="Georgia",
-                    font_size=42,
-                    color=(255, 248, 220),  # Cornsilk
-                    shadow=True,
-                    position="bottom",
-                    animation="typewriter"
-                ),
-                "chapter": TextStyle(
-                    font_family="Times New Roman",
-                    font_size=64,
-                    color=(255, 255, 255),
-                    position="middle",
-                    animation="fade"
-                )
-            },
+            text_styles=_STORYTELLING_TEXT_STYLES,
             music_genre="orchestral",
             color_scheme={
                 "primary": (255, 248, 220),  # Cornsilk
@@ -378,29 +445,15 @@ class VideoTemplateLibrary:
             name="Minimal",
             description="Clean, simple, modern style",
             transitions=[
-                TransitionConfig("fade", 0.8, "linear")
+                _intern(TransitionConfig("fade", 0.8, "linear"))
             ],
-            effects=EffectConfig(
+            effects=_intern(EffectConfig(
                 contrast=1.0,
                 saturation=0.8,
                 brightness=1.05
-            ),
+            )),
             camera_movements=[],
-            text_styles={
-                "title": TextStyle(
-                    font_family="Arial",
-                    font_size=48,
-                    color=(50, 50, 50),
-                    position="middle",
-                    animation="fade"
-                ),
-                "subtitle": TextStyle(
-                    font_family="Arial",
-                    font_size=28,
-                    color=(100, 100, 100),
-                    position="bottom"
-                )
-            },
+            text_styles=_MINIMAL_TEXT_STYLES,
             music_genre="minimal",
             color_scheme={
                 "primary": (50, 50, 50),
@@ -413,6 +466,9 @@ class VideoTemplateLibrary:
 class MusicLibrary:
     """Library of royalty-free music tracks."""
     
+    # Downloaded tracks, named by a hash of their URL
+    CACHE_DIR = os.path.join(tempfile.gettempdir(), "story_creator_music")
+    
     # Mapping of genres to free music URLs (these would be actual royalty-free tracks)
     MUSIC_SOURCES = {
         "epic": [
@@ -449,33 +505,242 @@ class MusicLibrary:
         ]
     }
     
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _genre_index(genre: str) -> Tuple[np.ndarray, Tuple[str, ...], Tuple[str, ...]]:
+        """A genre's tracks as parallel durations / names / urls, built once."""
+        tracks = MusicLibrary.MUSIC_SOURCES.get(genre, [])
+        durations = np.array([track["duration"] for track in tracks], dtype=np.int32)
+        durations.flags.writeable = False
+        return (
+            durations,
+            tuple(track["name"] for track in tracks),
+            tuple(track["url"] for track in tracks),
+        )
+    
+    # Track selections are cached per duration bucket of this many seconds
+    DURATION_BUCKET = 5
+    
     @staticmethod
     def get_track_for_genre(genre: str, duration: float) -> Optional[MusicTrack]:
         """Get appropriate music track for genre and duration."""
-        tracks = MusicLibrary.MUSIC_SOURCES.get(genre, [])
+        # Round up, so a track is still marked to loop whenever it is
+        # shorter than the requested duration
+        bucket = math.ceil(duration / MusicLibrary.DURATION_BUCKET) * MusicLibrary.DURATION_BUCKET
+        return MusicLibrary._nearest(genre, bucket)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _nearest(genre: str, duration: int) -> Optional[MusicTrack]:
+        """Track closest to duration (shared, frozen instance)."""
+        durations, _, urls = MusicLibrary._genre_index(genre)
+        if len(durations) == 0:
+            return None
         
         # Find track closest to needed duration
-        best_track = None
-        best_diff = float('inf')
+        idx = int(np.argmin(np.abs(durations - duration)))
+        return MusicTrack(
+            url=urls[idx],
+            volume=0.3,
+            fade_in=2.0,
+            fade_out=2.0,
+            loop=bool(durations[idx] < duration),
+            genre=genre
+        )
+    
+    @staticmethod
+    def _cache_path(url: str) -> str:
+        """Disk cache location for a downloaded track."""
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        extension = os.path.splitext(url.split("?", 1)[0])[1] or ".mp3"
+        return os.path.join(MusicLibrary.CACHE_DIR, digest + extension)
+    
+    @staticmethod
+    def _download(session: "requests.Session", url: str) -> Optional[str]:
+        """Download url into the cache unless already there; None on failure."""
+        import requests
         
-        for track in tracks:
-            diff = abs(track["duration"] - duration)
-            if diff < best_diff:
-                best_diff = diff
-                best_track = track
+        path = MusicLibrary._cache_path(url)
+        if os.path.exists(path):
+            return path
         
-        if best_track:
-            return MusicTrack(
-                url=best_track["url"],
-                volume=0.3,
-                fade_in=2.0,
-                fade_out=2.0,
-                loop=best_track["duration"] < duration,
-                genre=genre
-            )
+        partial = None
+        try:
+            # A unique temp file per download: Streamlit sessions are
+            # threads of one process and may fetch the same URL at once
+            fd, partial = tempfile.mkstemp(dir=MusicLibrary.CACHE_DIR, suffix=".part")
+            with os.fdopen(fd, "wb") as f:
+                with session.get(url, stream=True, timeout=30) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(chunk_size=1 << 16):
+                        f.write(chunk)
+            os.replace(partial, path)
+            return path
+        except (requests.RequestException, OSError):
+            if partial and os.path.exists(partial):
+                os.remove(partial)
+            return None
+    
+    @staticmethod
+    def prefetch(tracks: List[MusicTrack], max_workers: int = 8) -> Dict[str, str]:
+        """Download the tracks' remote URLs in parallel into the disk cache.
         
+        Returns a mapping of URL to local file for every track that is
+        now available. Repeat renders are served from the cache.
+        """
+        urls = list(dict.fromkeys(
+            track.url for track in tracks
+            if not track.file_path and track.url
+            and track.url.startswith(("http://", "https://"))
+        ))
+        if not urls:
+            return {}
+        
+        import requests
+        
+        os.makedirs(MusicLibrary.CACHE_DIR, exist_ok=True)
+        # One keep-alive session shared by all workers
+        with requests.Session() as session:
+            with ThreadPoolExecutor(min(max_workers, len(urls))) as executor:
+                paths = executor.map(
+                    lambda url: MusicLibrary._download(session, url), urls
+                )
+                return {url: path for url, path in zip(urls, paths) if path}
+    
+    @staticmethod
+    def _local_path(track: MusicTrack, fetched: Dict[str, str]) -> Optional[str]:
+        """Local file for a track: its file_path, a download, or a local url."""
+        if track.file_path:
+            return track.file_path
+        if track.url in fetched:
+            return fetched[track.url]
+        if track.url and os.path.exists(track.url):
+            return track.url
         return None
     
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _ffmpeg_exe() -> Optional[str]:
+        """ffmpeg on PATH, else the binary bundled with imageio-ffmpeg."""
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is not None:
+            return ffmpeg
+        try:
+            import imageio_ffmpeg
+            return imageio_ffmpeg.get_ffmpeg_exe()
+        except (ImportError, RuntimeError):
+            return None
+    
+    @staticmethod
+    def _mix_with_ffmpeg(
+        narration_audio: bytes,
+        music_path: str,
+        music_track: MusicTrack,
+        duration: float
+    ) -> Optional[bytes]:
+        """Mix in one ffmpeg decode -> filter -> encode pass; None if unavailable."""
+        ffmpeg = MusicLibrary._ffmpeg_exe()
+        if ffmpeg is None:
+            return None
+        
+        fade_out_start = max(0.0, duration - music_track.fade_out)
+        graph = (
+            f"[1:a]afade=t=in:d={music_track.fade_in},"
+            f"afade=t=out:st={fade_out_start}:d={music_track.fade_out},"
+            f"volume={music_track.volume}[bg];"
+            "[0:a][bg]amix=inputs=2:duration=first:normalize=0[out]"
+        )
+        command = [
+            ffmpeg, "-hide_banner", "-loglevel", "error",
+            "-f", "mp3", "-i", "pipe:0",
+            *(["-stream_loop", "-1"] if music_track.loop else []),
+            "-i", music_path,
+            "-filter_complex", graph, "-map", "[out]",
+            "-f", "mp3", "pipe:1"
+        ]
+        
+        try:
+            result = subprocess.run(
+                command, input=narration_audio, capture_output=True, timeout=300
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        
+        if result.returncode != 0 or not result.stdout:
+            return None
+        return result.stdout
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _fade_ramp(sample_rate: int, seconds: float, direction: str) -> np.ndarray:
+        """Read-only linear gain ramp, 0 -> 1 for "in" and 1 -> 0 for "out"."""
+        ramp = np.linspace(0, 1, max(0, int(sample_rate * seconds)), dtype=np.float32)
+        if direction == "out":
+            ramp = ramp[::-1].copy()
+        ramp.flags.writeable = False
+        return ramp
+    
+    @staticmethod
+    def _resample(samples: np.ndarray, in_rate: int, out_rate: int) -> np.ndarray:
+        """Resample (frames, channels) float32 audio to out_rate."""
+        if SOXR_AVAILABLE:
+            import soxr
+            return soxr.resample(samples, in_rate, out_rate, quality="HQ")
+        
+        # Linear interpolation onto the output sample clock
+        length = int(round(len(samples) * out_rate / in_rate))
+        positions = np.arange(length) * (in_rate / out_rate)
+        return np.stack([
+            np.interp(positions, np.arange(len(samples)), channel)
+            for channel in samples.T
+        ], axis=1).astype(np.float32)
+    
+    @staticmethod
+    def _mix_with_numpy(
+        narration_audio: bytes,
+        music_path: str,
+        music_track: MusicTrack,
+        duration: float
+    ) -> bytes:
+        """Mix decoded samples with NumPy (fallback when ffmpeg cannot run)."""
+        import soundfile as sf
+        
+        narration, sample_rate = sf.read(
+            BytesIO(narration_audio), dtype="float32", always_2d=True
+        )
+        music, music_rate = sf.read(music_path, dtype="float32", always_2d=True)
+        
+        if music_rate != sample_rate:
+            music = MusicLibrary._resample(music, music_rate, sample_rate)
+        if music.shape[1] != narration.shape[1]:
+            music = music.mean(axis=1, keepdims=True)
+        
+        # Loop or pad the music to the narration's length
+        num_samples = len(narration)
+        if music_track.loop and 0 < len(music) < num_samples:
+            music = np.tile(music, (math.ceil(num_samples / len(music)), 1))
+        if len(music) < num_samples:
+            music = np.pad(music, ((0, num_samples - len(music)), (0, 0)))
+        music = music[:num_samples] * np.float32(music_track.volume)
+        
+        # Fade envelopes timed as in _mix_with_ffmpeg: in from the start,
+        # out ending at duration with silence after (clipped to the mix)
+        fade_in = MusicLibrary._fade_ramp(sample_rate, music_track.fade_in, "in")
+        fade_out = MusicLibrary._fade_ramp(sample_rate, music_track.fade_out, "out")
+        head = music[:len(fade_in)]
+        np.multiply(head, fade_in[:len(head), None], out=head)
+        fade_out_start = int(max(0.0, duration - music_track.fade_out) * sample_rate)
+        tail = music[fade_out_start:fade_out_start + len(fade_out)]
+        np.multiply(tail, fade_out[:len(tail), None], out=tail)
+        music[fade_out_start + len(fade_out):] = 0
+        
+        np.add(narration, music, out=narration)
+        np.clip(narration, -1.0, 1.0, out=narration)
+        
+        output = BytesIO()
+        sf.write(output, narration, sample_rate, format="MP3")
+        return output.getvalue()
+    
     @staticmethod
     def apply_music_to_audio(
         narration_audio: bytes,
@@ -483,19 +748,26 @@ class MusicLibrary:
         duration: float
     ) -> bytes:
         """Mix narration with background music."""
-        if not PYDUB_AVAILABLE:
-            # Return original audio if pydub not available
+        # Fetch music (downloads are cached on disk)
+        music_path = MusicLibrary._local_path(
+            music_track, MusicLibrary.prefetch([music_track])
+        )
+        if music_path is None:
+            return narration_audio
+        
+        mixed = MusicLibrary._mix_with_ffmpeg(
+            narration_audio, music_path, music_track, duration
+        )
+        if mixed is not None:
+            return mixed
+        
+        if not SOUNDFILE_AVAILABLE:
+            # Return original audio if neither ffmpeg nor soundfile is available
             return narration_audio
             
         try:
-            # Load narration
-            narration = AudioSegment.from_file(
-                io.BytesIO(narration_audio), format="mp3"
+            return MusicLibrary._mix_with_numpy(
+                narration_audio, music_path, music_track, duration
             )
-            
-            # Load music (would need actual implementation)
-            # For now, return original narration
-            return narration_audio
-            
         except Exception:
             return narration_audio
\ No newline at end of file